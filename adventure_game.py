@@ -4,113 +4,228 @@ Interactive Text Adventure Game
 A terminal-based adventure where players explore rooms, solve puzzles, and defeat enemies.
 """
 
-import random
 import sys
+from random import Random as _Random
+
+# Shared RNG for combat rolls; binding randrange once avoids the
+# module-level lookup and randint->randrange wrapper on every attack.
+_RNG = _Random()
+_RAND = _RNG.randrange
+
+# Leading words of the one command that takes a free-form argument.
+_UNLOCK_WORDS = ("unlock", "door", "with")
+
+# Fixed banners and display templates, built once at import instead of
+# re-multiplying "="*60 and re-assembling the same lines on every
+# display. Templates carry {} placeholders for the few dynamic values,
+# so each banner is one format call and one buffer entry.
+_BAR_EQ = "=" * 60
+_BAR_BANG = "!" * 60
+_INTRO_TMPL = (
+    f"\n{_BAR_EQ}\n"
+    "         WELCOME TO THE SHADOW DUNGEON\n"
+    f"{_BAR_EQ}\n"
+    "\nYou awaken in a mysterious chamber with no memory of how you\n"
+    "arrived here. Your only choice is to venture forward and\n"
+    "discover what lies ahead...\n"
+    "\nType 'help' for a list of commands.\n"
+    f"{_BAR_EQ}\n"
+    "{desc}"
+)
+_COMBAT_START_TMPL = (
+    f"\n{_BAR_BANG}\n"
+    "  A DARK WARRIOR EMERGES FROM THE SHADOWS!\n"
+    f"{_BAR_BANG}\n"
+    "\nThe enemy blocks your path. You must fight!\n"
+    "\nEnemy Health: {ehp}/{emax} HP\n"
+    "Your Health: {php}/{pmax} HP\n"
+    "\nType 'attack' to fight!"
+)
+_VICTORY_TMPL = (
+    f"\n{_BAR_EQ}\n  VICTORY!\n{_BAR_EQ}\n"
+    "\nYou defeated the {name}!\n"
+    "\n🎉 CONGRATULATIONS! YOU WIN! 🎉\n"
+    "\nYou have conquered the Shadow Dungeon!\n"
+    f"{_BAR_EQ}"
+)
+_DEFEAT_BANNER = (
+    f"\n{_BAR_EQ}\n  DEFEAT!\n{_BAR_EQ}\n"
+    "\nYou have been defeated. Game Over.\n"
+    "\nThe darkness consumes you...\n"
+    f"{_BAR_EQ}"
+)
+
+# World topology as parallel tuples indexed by room ID. The map is fully
+# known up front, so navigation is an integer lookup and the arena check
+# is an integer compare instead of chasing room references.
+_START_ID = 0
+_TREASURY_ID = 1
+_ARENA_ID = 2
+_NO_ROOM = -1
+_ROOM_NORTH = (_TREASURY_ID, _ARENA_ID, _NO_ROOM)
+_ROOM_SOUTH = (_NO_ROOM, _START_ID, _TREASURY_ID)
+
+# Adjacency-matrix view of the same topology: _ADJ[room_id][dir_id] is
+# the neighboring room ID or _NO_ROOM, with columns ordered as
+# _DIR_NAMES. Graph queries use this; rendering keeps the Room objects.
+_DIR_NAMES = ("north", "south")
+_ADJ = tuple(zip(_ROOM_NORTH, _ROOM_SOUTH))
+
+
+def reachable_from(start):
+    """Returns the set of room IDs reachable from start, ignoring locks.
+
+    Expands a frontier level by level over _ADJ, so it scales with the
+    number of edges rather than requiring a walk over Room objects.
+    """
+    seen = {start}
+    frontier = [start]
+    while frontier:
+        nxt = []
+        for room_id in frontier:
+            for neighbor in _ADJ[room_id]:
+                if neighbor != _NO_ROOM and neighbor not in seen:
+                    seen.add(neighbor)
+                    nxt.append(neighbor)
+        frontier = nxt
+    return seen
 
 
 class Item:
     """Represents an item in the game."""
-    
+
+    __slots__ = ("name", "key", "description", "takeable",
+                 "_display_room", "_display_inv")
+
     def __init__(self, name, description, takeable=True):
         self.name = name
+        self.key = name.lower()
         self.description = description
         self.takeable = takeable
-    
-    def __str__(self):
+        # Listing lines, rendered once since the name never changes
+        self._display_room = f"  - A {name}\n"
+        self._display_inv = f"  - {name}\n"
+
+    def __repr__(self):
         return self.name
 
+    __str__ = __repr__
+
 
 class Room:
-    """Represents a room in the game world."""
-    
+    """Represents a room in the game world.
+
+    Rooms hold only what rendering needs (name, description, items,
+    exit labels); the connection topology lives in the module-level
+    _ROOM_NORTH/_ROOM_SOUTH tuples indexed by room ID.
+    """
+
+    __slots__ = ("name", "description", "items", "exits",
+                 "north_door_locked", "visited", "_desc_cache",
+                 "_short_desc")
+
     def __init__(self, name, description):
         self.name = name
         self.description = description
-        self.items = []
-        self.north = None
-        self.south = None
+        self.items = {}  # keyed by lowercased item name; insertion order preserved
+        self.exits = ()
         self.north_door_locked = False
         self.visited = False
-    
+        self._desc_cache = None
+        self._short_desc = None
+
     def get_full_description(self):
-        """Returns the full room description including items."""
-        desc = f"\n=== {self.name} ===\n{self.description}\n"
-        
+        """Returns the full room description including items.
+
+        The rendered string is cached; add_item/remove_item and door
+        state changes invalidate it.
+        """
+        if self._desc_cache is not None:
+            return self._desc_cache
+
+        parts = [f"\n=== {self.name} ===\n{self.description}\n"]
+
         if self.items:
-            desc += "\nYou can see:\n"
-            for item in self.items:
-                desc += f"  - A {item.name}\n"
-        
+            parts.append("\nYou can see:\n")
+            parts.extend(item._display_room for item in self.items.values())
+
         # Show available exits
-        exits = []
-        if self.north:
-            exits.append("north")
-        if self.south:
-            exits.append("south")
-        
-        if exits:
-            desc += f"\nExits: {', '.join(exits)}"
-        
-        return desc
+        if self.exits:
+            parts.append(f"\nExits: {', '.join(self.exits)}")
+
+        self._desc_cache = "".join(parts)
+        return self._desc_cache
+
+    def get_short_description(self):
+        """Returns a one-line summary for rooms the player has already seen."""
+        if self._short_desc is None:
+            self._short_desc = f"\n=== {self.name} === (exits: {', '.join(self.exits)})"
+        return self._short_desc
     
     def add_item(self, item):
         """Adds an item to the room."""
-        self.items.append(item)
-    
+        self.items[item.key] = item
+        self._desc_cache = None
+
     def remove_item(self, item_name):
         """Removes an item from the room by name."""
-        for item in self.items:
-            if item.name.lower() == item_name.lower():
-                self.items.remove(item)
-                return item
-        return None
-    
+        self._desc_cache = None
+        return self.items.pop(item_name.lower(), None)
+
     def get_item(self, item_name):
         """Gets an item from the room by name without removing it."""
-        for item in self.items:
-            if item.name.lower() == item_name.lower():
-                return item
-        return None
+        return self.items.get(item_name.lower())
 
 
 class Player:
     """Represents the player character."""
-    
+
+    __slots__ = ("inventory", "health", "max_health", "min_damage",
+                 "max_damage", "_max_plus1", "_inv_cache")
+
     def __init__(self):
-        self.inventory = []
+        self.inventory = {}  # keyed by lowercased item name
         self.health = 20
         self.max_health = 20
         self.min_damage = 1
         self.max_damage = 6
-    
+        self._max_plus1 = self.max_damage + 1
+        self._inv_cache = None
+
     def add_item(self, item):
         """Adds an item to inventory."""
-        self.inventory.append(item)
-    
+        self.inventory[item.key] = item
+        self._inv_cache = None
+
     def has_item(self, item_name):
         """Checks if player has an item."""
-        return any(item.name.lower() == item_name.lower() for item in self.inventory)
-    
+        return item_name.lower() in self.inventory
+
     def get_item(self, item_name):
         """Gets an item from inventory."""
-        for item in self.inventory:
-            if item.name.lower() == item_name.lower():
-                return item
-        return None
+        return self.inventory.get(item_name.lower())
+
+    def remove_item(self, item_name):
+        """Removes an item from inventory by name."""
+        self._inv_cache = None
+        return self.inventory.pop(item_name.lower(), None)
     
     def show_inventory(self):
-        """Returns inventory as a string."""
+        """Returns inventory as a string (cached until the inventory changes)."""
+        if self._inv_cache is not None:
+            return self._inv_cache
+
         if not self.inventory:
-            return "\nYour inventory is empty."
-        
-        inv_str = "\n=== Inventory ===\n"
-        for item in self.inventory:
-            inv_str += f"  - {item.name}\n"
-        return inv_str
+            self._inv_cache = "\nYour inventory is empty."
+        else:
+            parts = ["\n=== Inventory ===\n"]
+            parts.extend(item._display_inv for item in self.inventory.values())
+            self._inv_cache = "".join(parts)
+        return self._inv_cache
     
     def attack(self):
         """Returns damage dealt by player."""
-        return random.randint(self.min_damage, self.max_damage)
+        return _RAND(self.min_damage, self._max_plus1)
     
     def take_damage(self, damage):
         """Reduces player health."""
@@ -121,17 +236,21 @@ class Player:
 
 class Enemy:
     """Represents an enemy in combat."""
-    
+
+    __slots__ = ("name", "health", "max_health", "min_damage",
+                 "max_damage", "_max_plus1")
+
     def __init__(self, name, health, min_damage, max_damage):
         self.name = name
         self.health = health
         self.max_health = health
         self.min_damage = min_damage
         self.max_damage = max_damage
-    
+        self._max_plus1 = max_damage + 1
+
     def attack(self):
         """Returns damage dealt by enemy."""
-        return random.randint(self.min_damage, self.max_damage)
+        return _RAND(self.min_damage, self._max_plus1)
     
     def take_damage(self, damage):
         """Reduces enemy health."""
@@ -144,82 +263,128 @@ class Enemy:
         return self.health > 0
 
 
+def _build_world():
+    """Builds the per-game Room objects, indexed to match the topology tuples."""
+    room1 = Room(
+        "Starting Chamber",
+        "You find yourself in a dimly lit stone chamber. The walls are cold and damp.\n"
+        "A heavy wooden door stands to the north."
+    )
+
+    room2 = Room(
+        "Treasury Room",
+        "You enter a magnificent treasury filled with ancient artifacts and golden treasures.\n"
+        "The room sparkles with an otherworldly glow."
+    )
+
+    room3 = Room(
+        "Enemy Arena",
+        "You step into a vast arena. The air is thick with tension.\n"
+        "A menacing shadow moves in the darkness ahead!"
+    )
+
+    # Create items
+    key = Item("key", "A rusty iron key")
+    note = Item("note", "A weathered piece of parchment with writing on it", takeable=False)
+
+    # Place items in rooms
+    room1.add_item(key)
+    room2.add_item(note)
+
+    # Exit labels for rendering; topology itself is in the module tuples
+    room1.exits = ("north",)
+    room1.north_door_locked = True
+    room2.exits = ("north", "south")
+    room3.exits = ("south",)
+
+    return (room1, room2, room3)
+
+
 class Game:
     """Main game controller."""
-    
+
+    # Direction -> (topology row, whether the locked-door check applies).
+    _DIRS = {
+        "north": (_ROOM_NORTH, True),
+        "south": (_ROOM_SOUTH, False),
+    }
+
     def __init__(self):
         self.player = Player()
-        self.current_room = None
-        self.rooms = {}
+        self.world = _build_world()
+        self.current = _START_ID
         self.door_unlocked = False
-        self.password = "SHADOW"  # The correct password
+        # The correct password, interned so attempts (also interned at
+        # parse time) compare by pointer identity.
+        self.password = sys.intern("SHADOW")
         self.game_over = False
         self.game_won = False
         self.in_combat = False
         self.enemy = None
         self.enemy_defeated = False
-        
-        self.setup_game()
-    
-    def setup_game(self):
-        """Sets up the game world."""
-        # Create rooms
-        room1 = Room(
-            "Starting Chamber",
-            "You find yourself in a dimly lit stone chamber. The walls are cold and damp.\n"
-            "A heavy wooden door stands to the north."
-        )
-        
-        room2 = Room(
-            "Treasury Room",
-            "You enter a magnificent treasury filled with ancient artifacts and golden treasures.\n"
-            "The room sparkles with an otherworldly glow."
-        )
-        
-        room3 = Room(
-            "Enemy Arena",
-            "You step into a vast arena. The air is thick with tension.\n"
-            "A menacing shadow moves in the darkness ahead!"
-        )
-        
-        # Create items
-        key = Item("key", "A rusty iron key")
-        note = Item("note", "A weathered piece of parchment with writing on it", takeable=False)
-        
-        # Place items in rooms
-        room1.add_item(key)
-        room2.add_item(note)
-        
-        # Connect rooms
-        room1.north = room2
-        room1.north_door_locked = True
-        
-        room2.south = room1
-        room2.north = room3
-        
-        room3.south = room2
-        
-        # Store rooms
-        self.rooms = {
-            "room1": room1,
-            "room2": room2,
-            "room3": room3
+
+        # Combat line templates, filled in by start_combat once the enemy
+        # exists so each turn does a single substitution per line.
+        self._atk_fmt = None
+        self._strike_fmt = None
+        self._ehp_suffix = None
+        self._php_suffix = None
+
+        # Output buffer: multi-line blocks (intro, combat) are collected
+        # here and written with one stdout call instead of one per line.
+        self._out = []
+        self._emit = self._out.append
+
+        # Command dispatch: input is tokenized once and resolved with a
+        # single dict lookup — single-word commands key on the word,
+        # multiword commands key on the token tuple.
+        self._cmd_table = {
+            "help": self.show_help,
+            "quit": self._cmd_quit,
+            "exit": self._cmd_quit,
+            "q": self._cmd_quit,
+            "look": self._cmd_look,
+            "inventory": self._cmd_inventory,
+            "i": self._cmd_inventory,
         }
-        
-        # Set starting room
-        self.current_room = room1
-    
+        self._multi_table = {
+            ("take", "key"): self.take_key,
+            ("pick", "up", "key"): self.take_key,
+            ("get", "key"): self.take_key,
+            ("read", "note"): self.read_note,
+            ("examine", "note"): self.read_note,
+            ("look", "at", "note"): self.read_note,
+            ("open", "door"): self.open_door,
+            ("open", "north", "door"): self.open_door,
+        }
+
+        # Canonical command strings for readline tab completion.
+        self._commands = tuple(sorted(
+            list(self._cmd_table)
+            + [" ".join(words) for words in self._multi_table]
+            + ["attack", "go north", "go south", "unlock door with "]
+        ))
+
+        # Active input handler; flipped to _handle_combat while fighting
+        # so the per-line in_combat branch disappears from the loop.
+        self._handle = self._handle_normal
+
+    @property
+    def current_room(self):
+        """The Room object for the player's current location."""
+        return self.world[self.current]
+
+    def _flush(self):
+        """Writes all buffered output lines in a single stdout call."""
+        if self._out:
+            sys.stdout.write("\n".join(self._out) + "\n")
+            self._out.clear()
+
     def show_intro(self):
         """Displays the game introduction."""
-        print("\n" + "="*60)
-        print("         WELCOME TO THE SHADOW DUNGEON")
-        print("="*60)
-        print("\nYou awaken in a mysterious chamber with no memory of how you")
-        print("arrived here. Your only choice is to venture forward and")
-        print("discover what lies ahead...")
-        print("\nType 'help' for a list of commands.")
-        print("="*60)
-        print(self.current_room.get_full_description())
+        self.current_room.visited = True
+        self._emit(_INTRO_TMPL.format(desc=self.current_room.get_full_description()))
+        self._flush()
     
     def show_help(self):
         """Displays available commands."""
@@ -248,92 +413,82 @@ Utility:
 """
         print(help_text)
     
-    def process_command(self, command):
-        """Processes player commands."""
-        command = command.lower().strip()
-        
-        if not command:
-            return
-        
-        # Combat commands
-        if self.in_combat:
-            if command == "attack":
-                self.combat_turn()
-            else:
-                print("\nYou're in combat! You can only 'attack' or 'quit'.")
+    def _handle_combat(self, command):
+        """Processes player commands while in combat."""
+        if command.lower() == "attack":
+            self.combat_turn()
+        else:
+            print("\nYou're in combat! You can only 'attack' or 'quit'.")
+
+    def _handle_normal(self, command):
+        """Processes player commands outside combat."""
+        tokens = tuple(command.lower().split())
+        if not tokens:
             return
-        
-        # Parse command
-        parts = command.split()
-        action = parts[0] if parts else ""
-        
-        # Utility commands
-        if command == "help":
-            self.show_help()
-        
-        elif command in ["quit", "exit", "q"]:
-            print("\nThanks for playing! Goodbye.")
-            self.game_over = True
-        
-        # Navigation commands
-        elif command.startswith("go "):
-            direction = command[3:].strip()
-            self.move(direction)
-        
-        elif command == "look":
-            print(self.current_room.get_full_description())
-        
-        # Inventory
-        elif command in ["inventory", "i"]:
-            print(self.player.show_inventory())
-        
-        # Item interaction
-        elif command in ["take key", "pick up key", "get key"]:
-            self.take_key()
-        
-        elif command in ["read note", "examine note", "look at note"]:
-            self.read_note()
-        
-        # Door interaction
-        elif command.startswith("unlock door with "):
-            password = command[17:].strip().upper()
-            self.unlock_door(password)
-        
-        elif command in ["open door", "open north door"]:
-            self.open_door()
-        
+
+        if len(tokens) == 1:
+            handler = self._cmd_table.get(tokens[0])
         else:
-            print("\nI don't understand that command. Type 'help' for available commands.")
-    
+            handler = self._multi_table.get(tokens)
+        if handler is not None:
+            handler()
+            return
+
+        if tokens[0] == "go" and len(tokens) == 2:
+            self.move(tokens[1])
+            return
+
+        if len(tokens) > 3 and tokens[:3] == _UNLOCK_WORDS:
+            password = tokens[3] if len(tokens) == 4 else " ".join(tokens[3:])
+            self.unlock_door(sys.intern(password.upper()))
+            return
+
+        print("\nI don't understand that command. Type 'help' for available commands.")
+
+    def _cmd_quit(self):
+        """Handles the quit command."""
+        print("\nThanks for playing! Goodbye.")
+        self.game_over = True
+
+    def _cmd_look(self):
+        """Handles the look command."""
+        print(self.current_room.get_full_description())
+
+    def _cmd_inventory(self):
+        """Handles the inventory command."""
+        print(self.player.show_inventory())
+
     def move(self, direction):
-        """Handles room navigation."""
-        direction = direction.lower()
-        
-        if direction == "north":
-            if self.current_room.north:
-                # Check if door is locked
-                if self.current_room.north_door_locked:
-                    print("\nThe door is locked. You need to unlock it first.")
-                    return
-                
-                self.current_room = self.current_room.north
-                print(self.current_room.get_full_description())
-                
-                # Check if entering Room 3 (Enemy Arena)
-                if self.current_room.name == "Enemy Arena" and not self.enemy_defeated:
-                    self.start_combat()
-            else:
-                print("\nYou can't go that way.")
-        
-        elif direction == "south":
-            if self.current_room.south:
-                self.current_room = self.current_room.south
-                print(self.current_room.get_full_description())
-            else:
-                print("\nYou can't go that way.")
-        
-        else:
+        """Handles room navigation. The direction is already lowercased."""
+        entry = self._DIRS.get(direction)
+        if entry is None:
             print("\nYou can only go 'north' or 'south'.")
+            return
+
+        topology, check_lock = entry
+        nxt = topology[self.current]
+        if nxt == _NO_ROOM:
+            print("\nYou can't go that way.")
+            return
+
+        # Check if door is locked
+        if check_lock and self.current_room.north_door_locked:
+            print("\nThe door is locked. You need to unlock it first.")
+            return
+
+        self.current = nxt
+        room = self.current_room
+
+        # Full description on first entry, one-line summary on revisits
+        if room.visited:
+            print(room.get_short_description())
+        else:
+            room.visited = True
+            print(room.get_full_description())
+
+        # Check if entering the Enemy Arena
+        if self.current == _ARENA_ID and not self.enemy_defeated:
+            self.start_combat()
     
     def take_key(self):
         """Handles taking the key."""
@@ -366,10 +521,12 @@ Utility:
             print("\nYou don't have a key.")
             return
         
-        if password == self.password:
+        if password is self.password:
             print("\nThe door unlocks with a click! You can now go north.")
             self.door_unlocked = True
-            self.rooms["room1"].north_door_locked = False
+            room1 = self.world[_START_ID]
+            room1.north_door_locked = False
+            room1._desc_cache = None
         else:
             print("\nThe password is incorrect.")
     
@@ -385,76 +542,105 @@ Utility:
     
     def start_combat(self):
         """Initiates combat with the enemy."""
-        print("\n" + "!"*60)
-        print("  A DARK WARRIOR EMERGES FROM THE SHADOWS!")
-        print("!"*60)
-        print("\nThe enemy blocks your path. You must fight!")
-        
-        self.enemy = Enemy("Dark Warrior", 10, 1, 4)
+        enemy = self.enemy = Enemy("Dark Warrior", 10, 1, 4)
         self.in_combat = True
-        
-        print(f"\nEnemy Health: {self.enemy.health}/{self.enemy.max_health} HP")
-        print(f"Your Health: {self.player.health}/{self.player.max_health} HP")
-        print("\nType 'attack' to fight!")
+        self._handle = self._handle_combat
+
+        # The enemy name and both max-health values are fixed for the
+        # whole fight; bake them into per-fight templates.
+        self._atk_fmt = "\nYou attack the " + enemy.name + " for {} damage!"
+        self._strike_fmt = "\nThe " + enemy.name + " strikes back for {} damage!"
+        self._ehp_suffix = f"/{enemy.max_health} HP"
+        self._php_suffix = f"/{self.player.max_health} HP"
+
+        self._emit(_COMBAT_START_TMPL.format(
+            ehp=enemy.health, emax=enemy.max_health,
+            php=self.player.health, pmax=self.player.max_health,
+        ))
+        self._flush()
     
     def combat_turn(self):
         """Handles a turn of combat."""
         if not self.enemy or not self.in_combat:
             return
         
+        emit = self._emit
+
         # Player attacks first
         player_damage = self.player.attack()
         self.enemy.take_damage(player_damage)
-        
-        print(f"\nYou attack the {self.enemy.name} for {player_damage} damage!")
-        print(f"Enemy Health: {self.enemy.health}/{self.enemy.max_health} HP")
-        
+
+        emit(self._atk_fmt.format(player_damage))
+        emit("Enemy Health: " + str(self.enemy.health) + self._ehp_suffix)
+
         # Check if enemy is defeated
         if not self.enemy.is_alive():
-            print("\n" + "="*60)
-            print("  VICTORY!")
-            print("="*60)
-            print(f"\nYou defeated the {self.enemy.name}!")
-            print("\n🎉 CONGRATULATIONS! YOU WIN! 🎉")
-            print("\nYou have conquered the Shadow Dungeon!")
-            print("="*60)
-            
+            emit(_VICTORY_TMPL.format(name=self.enemy.name))
+            self._flush()
+
             self.in_combat = False
+            self._handle = self._handle_normal
             self.enemy_defeated = True
             self.game_won = True
             self.game_over = True
             return
-        
+
         # Enemy attacks
         enemy_damage = self.enemy.attack()
         self.player.take_damage(enemy_damage)
-        
-        print(f"\nThe {self.enemy.name} strikes back for {enemy_damage} damage!")
-        print(f"Your Health: {self.player.health}/{self.player.max_health} HP")
-        
+
+        emit(self._strike_fmt.format(enemy_damage))
+        emit("Your Health: " + str(self.player.health) + self._php_suffix)
+
         # Check if player is defeated
         if self.player.health <= 0:
-            print("\n" + "="*60)
-            print("  DEFEAT!")
-            print("="*60)
-            print("\nYou have been defeated. Game Over.")
-            print("\nThe darkness consumes you...")
-            print("="*60)
-            
+            emit(_DEFEAT_BANNER)
+            self._flush()
+
             self.in_combat = False
+            self._handle = self._handle_normal
             self.game_over = True
             return
-        
-        print("\nWhat will you do?")
+
+        emit("\nWhat will you do?")
+        self._flush()
     
+    def simulate_balance(self, n):
+        """Estimates the player's win rate over n simulated fights."""
+        from combat_kernel import simulate_balance
+
+        return simulate_balance(
+            n,
+            p_hp=self.player.max_health,
+            p_min=self.player.min_damage,
+            p_max=self.player.max_damage,
+        )
+
+    def _complete(self, text, state):
+        """readline completer: offers the known commands for the typed prefix."""
+        matches = [cmd for cmd in self._commands if cmd.startswith(text)]
+        return matches[state] if state < len(matches) else None
+
     def run(self):
         """Main game loop."""
+        # Line editing, history and tab completion for the prompt; the
+        # readline module is optional (absent on some Windows builds).
+        try:
+            import readline
+        except ImportError:
+            pass
+        else:
+            readline.parse_and_bind("tab: complete")
+            readline.set_completer(self._complete)
+
         self.show_intro()
         
         while not self.game_over:
             try:
                 command = input("\n> ").strip()
-                self.process_command(command)
+                if not command:
+                    continue
+                self._handle(command)
             except KeyboardInterrupt:
                 print("\n\nGame interrupted. Thanks for playing!")
                 break
@@ -466,6 +652,14 @@ Utility:
 def main():
     """Entry point for the game."""
     game = Game()
+
+    # Offline balance mode: simulate fights instead of playing.
+    if len(sys.argv) > 1 and sys.argv[1] == "--simulate":
+        n = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+        rate = game.simulate_balance(n)
+        print(f"Player win rate over {n} fights: {rate:.1%}")
+        return
+
     game.run()
 
 